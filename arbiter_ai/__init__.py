@@ -77,6 +77,7 @@ from .core import (
     LLMClient,
     LLMInteraction,
     LLMManager,
+    LogAndMetricsMiddleware,
     LoggingMiddleware,
     Metric,
     MetricsMiddleware,
@@ -161,6 +162,7 @@ __all__ = [
     "MiddlewarePipeline",
     "LoggingMiddleware",
     "MetricsMiddleware",
+    "LogAndMetricsMiddleware",
     "CachingMiddleware",
     "RateLimitingMiddleware",
     # Monitoring
@@ -29,6 +29,7 @@ from .llm_client import LLMClient, LLMManager, LLMResponse, Provider
 from .llm_client_pool import ConnectionMetrics, LLMClientPool, PoolConfig
 from .middleware import (
     CachingMiddleware,
+    LogAndMetricsMiddleware,
     LoggingMiddleware,
     MetricsMiddleware,
     Middleware,
@@ -113,6 +114,7 @@ __all__ = [
     "MiddlewarePipeline",
     "LoggingMiddleware",
     "MetricsMiddleware",
+    "LogAndMetricsMiddleware",
     "CachingMiddleware",
     "RateLimitingMiddleware",
     "monitor_context",
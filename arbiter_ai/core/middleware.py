@@ -16,6 +16,7 @@ Middleware components form a chain where each component can:
 
 - **LoggingMiddleware**: Logs all evaluation operations
 - **MetricsMiddleware**: Collects performance metrics
+- **LogAndMetricsMiddleware**: Logging and metrics fused into one step
 - **CachingMiddleware**: Caches evaluation results
 - **RateLimitingMiddleware**: Limits request rate
 
@@ -76,6 +77,7 @@ __all__ = [
     "Middleware",
     "LoggingMiddleware",
     "MetricsMiddleware",
+    "LogAndMetricsMiddleware",
     "CachingMiddleware",
     "RateLimitingMiddleware",
     "MiddlewarePipeline",
@@ -84,6 +86,68 @@ __all__ = [
 ]
 
 
+def _log_request(
+    log_level: int,
+    output: str,
+    reference: Optional[str],
+    context: MiddlewareContext,
+) -> None:
+    """Log the start of an evaluation.
+
+    Gated on ``isEnabledFor`` so a suppressed level skips slicing outputs
+    and building messages entirely.
+    """
+    if not logger.isEnabledFor(log_level):
+        return
+
+    logger.log(log_level, "Starting evaluation for output: %s...", output[:100])
+    if reference:
+        logger.log(log_level, "Reference: %s...", reference[:100])
+
+    metrics_list = context.get("metrics", [])
+    logger.log(
+        log_level,
+        "Context: evaluators=%s, metrics=%d",
+        context.get("evaluators", []),
+        len(metrics_list) if metrics_list else 0,
+    )
+
+
+def _log_result(log_level: int, result: MiddlewareResult, elapsed: float) -> None:
+    """Log a completed evaluation or comparison."""
+    if not logger.isEnabledFor(log_level):
+        return
+
+    logger.log(log_level, "Evaluation completed in %.2fs", elapsed)
+
+    # Handle both EvaluationResult and ComparisonResult
+    if isinstance(result, EvaluationResult):
+        logger.log(
+            log_level,
+            "Result: overall_score=%.3f, passed=%s, num_scores=%d",
+            result.overall_score,
+            result.passed,
+            len(result.scores),
+        )
+    elif isinstance(result, ComparisonResult):
+        logger.log(
+            log_level,
+            "Result: winner=%s, confidence=%.3f",
+            result.winner,
+            result.confidence,
+        )
+
+
+def _log_failure(error: Exception, elapsed: float) -> None:
+    """Log a failed evaluation."""
+    logger.error(
+        "Evaluation failed after %.2fs: %s: %s",
+        elapsed,
+        type(error).__name__,
+        error,
+    )
+
+
 class Middleware(ABC):
     """Abstract base class for all middleware components.
 
@@ -205,46 +269,15 @@ class LoggingMiddleware(Middleware):
     ) -> MiddlewareResult:
         """Log the evaluation process."""
         start_time = time.time()
-
-        logger.log(self.log_level, f"Starting evaluation for output: {output[:100]}...")
-        if reference:
-            logger.log(self.log_level, f"Reference: {reference[:100]}...")
-
-        metrics_list = context.get("metrics", [])
-        logger.log(
-            self.log_level,
-            f"Context: evaluators={context.get('evaluators', [])}, "
-            f"metrics={len(metrics_list) if metrics_list else 0}",
-        )
+        _log_request(self.log_level, output, reference, context)
 
         try:
             result: MiddlewareResult = await next_handler(output, reference)
-
-            elapsed = time.time() - start_time
-            logger.log(self.log_level, f"Evaluation completed in {elapsed:.2f}s")
-
-            # Handle both EvaluationResult and ComparisonResult
-            if isinstance(result, EvaluationResult):
-                logger.log(
-                    self.log_level,
-                    f"Result: overall_score={result.overall_score:.3f}, "
-                    f"passed={result.passed}, "
-                    f"num_scores={len(result.scores)}",
-                )
-            elif isinstance(result, ComparisonResult):
-                logger.log(
-                    self.log_level,
-                    f"Result: winner={result.winner}, "
-                    f"confidence={result.confidence:.3f}",
-                )
-
+            _log_result(self.log_level, result, time.time() - start_time)
             return result
 
         except Exception as e:
-            elapsed = time.time() - start_time
-            logger.error(
-                f"Evaluation failed after {elapsed:.2f}s: {type(e).__name__}: {e!s}"
-            )
+            _log_failure(e, time.time() - start_time)
             raise
 
 
@@ -282,19 +315,23 @@ class MetricsMiddleware(Middleware):
         Creates a metrics dictionary that tracks:
         - total_requests: Number of evaluate() calls
         - total_time: Cumulative processing time
-        - average_score: Running average of overall scores
         - errors: Count of failed requests
         - llm_calls: Total LLM API calls made
         - tokens_used: Total tokens consumed
+        - completed_requests: Number of successful requests
+        - score_sum: Sum of scores of successful requests
+
+        average_score is derived from score_sum in get_metrics().
         """
         self.metrics = {
             "total_requests": 0,
             "total_time": 0.0,
-            "average_score": 0.0,
             "errors": 0,
             "llm_calls": 0,
             "tokens_used": 0,
             "passed_count": 0,
+            "completed_requests": 0,
+            "score_sum": 0.0,
         }
 
     async def process(
@@ -314,45 +351,57 @@ class MetricsMiddleware(Middleware):
 
             result: MiddlewareResult = await next_handler(output, reference)
 
-            # Update metrics
-            elapsed = time.time() - start_time
-            self.metrics["total_time"] += elapsed
-
-            # Update average score based on result type
-            total = self.metrics["total_requests"]
-            old_avg = self.metrics["average_score"]
-            if isinstance(result, EvaluationResult):
-                score_value = result.overall_score
-                # Track pass/fail
-                if result.passed:
-                    self.metrics["passed_count"] += 1
-            else:  # isinstance(result, ComparisonResult)
-                score_value = result.confidence
-
-            self.metrics["average_score"] = (
-                old_avg * (total - 1) + float(score_value)
-            ) / total
-
-            # Track LLM calls
-            final_llm_calls = context.get("llm_calls", 0)
-            if isinstance(final_llm_calls, (int, float)) and isinstance(
-                initial_llm_calls, (int, float)
-            ):
-                self.metrics["llm_calls"] += int(final_llm_calls - initial_llm_calls)
-
-            # Track tokens
-            self.metrics["tokens_used"] += result.total_tokens
-
+            self._record_result(
+                result, time.time() - start_time, initial_llm_calls, context
+            )
             return result
 
         except Exception:
             self.metrics["errors"] += 1
             raise
 
+    def _record_result(
+        self,
+        result: MiddlewareResult,
+        elapsed: float,
+        initial_llm_calls: Any,
+        context: MiddlewareContext,
+    ) -> None:
+        """Update metrics for a successful request."""
+        self.metrics["total_time"] += elapsed
+
+        # Accumulate score based on result type; get_metrics() averages it
+        if isinstance(result, EvaluationResult):
+            score_value = result.overall_score
+            # Track pass/fail
+            if result.passed:
+                self.metrics["passed_count"] += 1
+        else:  # isinstance(result, ComparisonResult)
+            score_value = result.confidence
+
+        self.metrics["completed_requests"] += 1
+        self.metrics["score_sum"] += float(score_value)
+
+        # Track LLM calls
+        final_llm_calls = context.get("llm_calls", 0)
+        if isinstance(final_llm_calls, (int, float)) and isinstance(
+            initial_llm_calls, (int, float)
+        ):
+            self.metrics["llm_calls"] += int(final_llm_calls - initial_llm_calls)
+
+        # Track tokens
+        self.metrics["tokens_used"] += result.total_tokens
+
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics with calculated averages."""
         metrics = self.metrics.copy()
 
+        # Average over completed requests; total_requests includes in-flight ones
+        completed = metrics["completed_requests"]
+        metrics["average_score"] = (
+            metrics["score_sum"] / completed if completed else 0.0
+        )
+
         # Calculate averages
         if metrics["total_requests"] > 0:
             metrics["avg_time_per_request"] = (
@@ -366,6 +415,65 @@ class MetricsMiddleware(Middleware):
         return metrics
 
 
+class LogAndMetricsMiddleware(MetricsMiddleware):
+    """Middleware that logs evaluations and collects metrics in one step.
+
+    Equivalent to ``LoggingMiddleware`` followed by ``MetricsMiddleware``,
+    but with a single ``process`` call, timer, and context lookup per
+    request instead of two chained middleware. Useful for pipelines that
+    dispatch many evaluations, such as large A/B test suites.
+
+    Exposes the same ``get_metrics()`` as MetricsMiddleware, and is found
+    by ``pipeline.get_middleware(MetricsMiddleware)``.
+
+    Example:
+        >>> log_and_metrics = LogAndMetricsMiddleware(log_level="WARNING")
+        >>> pipeline = MiddlewarePipeline([log_and_metrics])
+        >>>
+        >>> for output, ref in test_cases:
+        ...     await evaluate(output, ref, middleware=pipeline)
+        >>>
+        >>> print(log_and_metrics.get_metrics()["avg_time_per_request"])
+    """
+
+    def __init__(self, log_level: str = "INFO"):
+        """Initialize logging level and zeroed metrics.
+
+        Args:
+            log_level: Logging level as string ("DEBUG", "INFO", "WARNING",
+                "ERROR"). Case-insensitive.
+        """
+        super().__init__()
+        self.log_level = getattr(logging, log_level.upper())
+
+    async def process(
+        self,
+        output: str,
+        reference: Optional[str],
+        next_handler: Callable[[str, Optional[str]], Any],
+        context: MiddlewareContext,
+    ) -> MiddlewareResult:
+        """Log the evaluation and collect metrics about it."""
+        start_time = time.time()
+        self.metrics["total_requests"] += 1
+        _log_request(self.log_level, output, reference, context)
+
+        try:
+            initial_llm_calls = context.get("llm_calls", 0)
+
+            result: MiddlewareResult = await next_handler(output, reference)
+
+            elapsed = time.time() - start_time
+            self._record_result(result, elapsed, initial_llm_calls, context)
+            _log_result(self.log_level, result, elapsed)
+            return result
+
+        except Exception as e:
+            self.metrics["errors"] += 1
+            _log_failure(e, time.time() - start_time)
+            raise
+
+
 class CachingMiddleware(Middleware):
     """Caches evaluation results for identical inputs.
 
@@ -5,13 +5,13 @@ evaluation framework, including provider enumerations, evaluator types,
 and storage types.
 """
 
-from enum import Enum
+from enum import StrEnum
 from typing import Literal
 
 __all__ = ["Provider", "MetricType", "StorageType", "EvaluatorName"]
 
 
-class Provider(str, Enum):
+class Provider(StrEnum):
     """Enumeration of supported LLM providers.
 
     Each provider represents a different LLM API service. The enum
@@ -35,7 +35,7 @@ class Provider(str, Enum):
     COHERE = "cohere"
 
 
-class MetricType(str, Enum):
+class MetricType(StrEnum):
     """Types of evaluation metrics.
 
     Defines the standard metrics that evaluators can compute.
@@ -50,7 +50,7 @@ class MetricType(str, Enum):
     CUSTOM = "custom"
 
 
-class StorageType(str, Enum):
+class StorageType(StrEnum):
     """Types of storage backends.
 
     Defines the available storage backend options for persisting
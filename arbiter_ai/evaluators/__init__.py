@@ -30,7 +30,7 @@ from .pairwise import (
     PairwiseResponse,
 )
 from .relevance import RelevanceEvaluator, RelevanceResponse
-from .semantic import SemanticEvaluator, SemanticResponse
+from .semantic import SemanticCache, SemanticEvaluator, SemanticResponse
 from .similarity_backends import (
     FAISSSimilarityBackend,
     LLMSimilarityBackend,
@@ -43,6 +43,7 @@ __all__ = [
     "EvaluatorResponse",
     "SemanticEvaluator",
     "SemanticResponse",
+    "SemanticCache",
     "CustomCriteriaEvaluator",
     "CustomCriteriaResponse",
     "MultiCriteriaResponse",
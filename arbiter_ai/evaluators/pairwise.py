@@ -242,6 +242,67 @@ Provide clear reasoning that helps understand your decision."""
 
         return "\n".join(prompt_parts)
 
+    def _get_comparison_prompt(
+        self,
+        output_a: str,
+        output_b: str,
+        criteria: Optional[str],
+        reference: Optional[str],
+    ) -> str:
+        """Get user prompt for an explicit output_a vs output_b comparison.
+
+        Used by compare(), and by callers that submit comparisons outside the
+        realtime API (e.g. provider batch jobs) and need identical prompts.
+
+        Args:
+            output_a: First output to compare
+            output_b: Second output to compare
+            criteria: Optional evaluation criteria
+            reference: Optional reference context
+
+        Returns:
+            Formatted comparison prompt
+        """
+        prompt_parts = [
+            "Compare these two outputs and determine which is better:",
+            "",
+            "OUTPUT A:",
+            output_a,
+            "",
+            "OUTPUT B:",
+            output_b,
+        ]
+
+        if reference:
+            prompt_parts.extend(["", "REFERENCE CONTEXT:", reference])
+
+        if criteria:
+            prompt_parts.extend(
+                [
+                    "",
+                    "EVALUATION CRITERIA:",
+                    criteria,
+                    "",
+                    "Compare the outputs on each criterion and provide:",
+                    "1. A score (0.0-1.0) for each output on each criterion",
+                    "2. Reasoning for each comparison",
+                    "3. An overall winner (output_a, output_b, or tie)",
+                    "4. Overall confidence and reasoning",
+                ]
+            )
+        else:
+            prompt_parts.extend(
+                [
+                    "",
+                    "Compare the outputs overall and determine:",
+                    "1. Which output is better (output_a, output_b, or tie)",
+                    "2. Your confidence in this decision",
+                    "3. Detailed reasoning explaining your choice",
+                ]
+            )
+
+        return "\n".join(prompt_parts)
+
     def _get_response_type(self) -> Type[BaseModel]:
         """Use pairwise response model."""
         return PairwiseResponse
@@ -348,45 +409,9 @@ Provide clear reasoning that helps understand your decision."""
             await self._ensure_client()
 
             # Build comparison prompt
-            prompt_parts = [
-                "Compare these two outputs and determine which is better:",
-                "",
-                "OUTPUT A:",
-                output_a,
-                "",
-                "OUTPUT B:",
-                output_b,
-            ]
-
-            if reference:
-                prompt_parts.extend(["", "REFERENCE CONTEXT:", reference])
-
-            if criteria:
-                prompt_parts.extend(
-                    [
-                        "",
-                        "EVALUATION CRITERIA:",
-                        criteria,
-                        "",
-                        "Compare the outputs on each criterion and provide:",
-                        "1. A score (0.0-1.0) for each output on each criterion",
-                        "2. Reasoning for each comparison",
-                        "3. An overall winner (output_a, output_b, or tie)",
-                        "4. Overall confidence and reasoning",
-                    ]
-                )
-            else:
-                prompt_parts.extend(
-                    [
-                        "",
-                        "Compare the outputs overall and determine:",
-                        "1. Which output is better (output_a, output_b, or tie)",
-                        "2. Your confidence in this decision",
-                        "3. Detailed reasoning explaining your choice",
-                    ]
-                )
-
-            user_prompt = "\n".join(prompt_parts)
+            user_prompt = self._get_comparison_prompt(
+                output_a, output_b, criteria, reference
+            )
 
             # Create PydanticAI agent with structured output
             system_prompt = self._get_system_prompt()
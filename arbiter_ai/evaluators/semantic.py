@@ -25,6 +25,18 @@ even if they use different wording. Supports two backends:
 - No explanations (just scores)
 - Best for: Batch processing, development/testing
 
+## Exact Matches:
+
+Pairs whose output equals the reference, or equals it after normalizing case
+and whitespace, score 1.0 without calling either backend. Such scores carry
+``metadata["exact_match"]`` set to ``"exact"`` or ``"normalized"``.
+
+## Caching:
+
+Pass ``cache=SemanticCache()`` to reuse scores for repeated or near-duplicate
+(output, reference) pairs, e.g. in regression suites. Hits skip the backend
+entirely and are marked with ``metadata["cache_hit"] = True``.
+
 ## Example:
 
     >>> # LLM backend (default)
@@ -45,8 +57,12 @@ even if they use different wording. Supports two backends:
     >>> print(f"Similarity: {score.value:.2f}")  # Fast, free, no explanation
 """
 
-from typing import Literal, Optional, Type, cast
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Final, Literal, Optional, Sequence, Type, cast
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from ..core.llm_client import LLMClient
@@ -58,16 +74,48 @@ from .similarity_backends import (
     SimilarityBackend,
 )
 
-__all__ = ["SemanticEvaluator", "SemanticResponse"]
+__all__ = ["SemanticEvaluator", "SemanticResponse", "SemanticCache"]
+
+_SEMANTIC_SYSTEM_PROMPT: Final = """You evaluate semantic similarity: how closely two texts match in MEANING, not wording.
+Ignore phrasing, grammar, and style unless they change meaning.
+Score from 0.0 (different meaning) to 1.0 (identical meaning), with your confidence, an explanation, and key similarities and differences."""
+
+_SIMILARITY_PROMPT_TEMPLATE: Final = """Compare the semantic similarity of these two texts:
+
+OUTPUT (to evaluate):
+{output}
+
+REFERENCE (ground truth):
+{reference}
+
+Assess how similar they are in MEANING. Consider whether they convey the same information,
+even if expressed differently. Provide a detailed analysis."""
+
+_CRITERIA_PROMPT_TEMPLATE: Final = """Evaluate the semantic quality of this text based on the criteria: {criteria}
+
+Text to evaluate:
+{output}
+
+Provide your semantic quality assessment."""
+
+_COHERENCE_PROMPT_TEMPLATE: Final = """Evaluate the semantic coherence and clarity of this text:
+
+{output}
+
+Assess how well the text conveys clear meaning and logical ideas."""
 
 
 class SemanticResponse(BaseModel):
-    """Structured response for semantic similarity evaluation."""
+    """Structured response for semantic similarity evaluation.
+
+    Instances are immutable: they are validated once when parsed from the
+    LLM response and then only read.
+    """
 
     model_config = ConfigDict(
         extra="forbid",
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
     )
 
     score: float = Field(
@@ -115,6 +163,169 @@ class SemanticResponse(BaseModel):
         return self
 
 
+def _normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace for exact-match comparison."""
+    return " ".join(text.lower().split())
+
+
+@dataclass
+class _CacheEntry:
+    """Cached score with the normalized embedding it was stored under."""
+
+    vector: np.ndarray
+    criteria: Optional[str]
+    score: Score
+    created_at: float
+
+
+class SemanticCache:
+    """In-memory cache of semantic scores keyed by pair embeddings.
+
+    Regression suites often re-evaluate identical or near-identical
+    (output, reference) pairs. The cache embeds each pair, and if a stored
+    pair has cosine similarity above the threshold (and the same criteria),
+    returns its score instead of calling the LLM again.
+
+    Entries expire after ``ttl`` seconds and the least recently used entry
+    is evicted once ``max_size`` is reached. Embeddings default to a local
+    sentence-transformers model (requires: pip install arbiter[scale]).
+
+    Example:
+        >>> cache = SemanticCache(threshold=0.95, ttl=300.0)
+        >>> evaluator = SemanticEvaluator(llm_client, cache=cache)
+        >>> score = await evaluator.evaluate(output, reference)  # LLM call
+        >>> score = await evaluator.evaluate(output, reference)  # cache hit
+        >>> print(score.metadata["cache_hit"])  # True
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        ttl: float = 300.0,
+        max_size: int = 1024,
+        embedder: Optional[Callable[[str], Sequence[float]]] = None,
+        model_name: str = "all-MiniLM-L6-v2",
+    ):
+        """Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            ttl: Seconds before an entry expires
+            max_size: Maximum number of entries (LRU eviction beyond this)
+            embedder: Optional function mapping text to an embedding vector.
+                     Defaults to a local sentence-transformers model.
+            model_name: Sentence-transformers model used when no embedder given
+
+        Raises:
+            ImportError: If no embedder given and sentence-transformers not installed
+            ValueError: If threshold, ttl, or max_size are out of range
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+
+        if embedder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError(
+                    "SemanticCache requires sentence-transformers unless an "
+                    "embedder is provided. Install with: pip install arbiter[scale]"
+                )
+
+            model = SentenceTransformer(model_name)
+            embedder = model.encode
+
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_size = max_size
+        self._embedder = embedder
+        self._entries: OrderedDict[int, _CacheEntry] = OrderedDict()
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, output: str, reference: Optional[str]) -> np.ndarray:
+        """Embed an (output, reference) pair as an L2-normalized vector."""
+        vector = np.asarray(
+            self._embedder(f"{output}\n\n{reference or ''}"), dtype=np.float32
+        )
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def get(self, vector: np.ndarray, criteria: Optional[str]) -> Optional[Score]:
+        """Return the cached score for the nearest matching pair, if any.
+
+        Args:
+            vector: Normalized pair embedding from embed()
+            criteria: Criteria the evaluation was run with (must match exactly)
+
+        Returns:
+            Cached Score, or None on a miss
+        """
+        self._expire()
+
+        candidates = [
+            (entry_id, entry)
+            for entry_id, entry in self._entries.items()
+            if entry.criteria == criteria
+        ]
+        if candidates:
+            matrix = np.stack([entry.vector for _, entry in candidates])
+            similarities = matrix @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                entry_id, entry = candidates[best]
+                self._entries.move_to_end(entry_id)
+                self.hits += 1
+                return entry.score
+
+        self.misses += 1
+        return None
+
+    def put(self, vector: np.ndarray, criteria: Optional[str], score: Score) -> None:
+        """Store a score under a normalized pair embedding."""
+        self._entries[self._next_id] = _CacheEntry(
+            vector=vector, criteria=criteria, score=score, created_at=time.time()
+        )
+        self._next_id += 1
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, float]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, and size
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "size": len(self._entries),
+        }
+
+    def _expire(self) -> None:
+        """Drop entries older than the TTL."""
+        cutoff = time.time() - self.ttl
+        expired = [
+            entry_id
+            for entry_id, entry in self._entries.items()
+            if entry.created_at < cutoff
+        ]
+        for entry_id in expired:
+            del self._entries[entry_id]
+
+
 class SemanticEvaluator(BasePydanticEvaluator):
     """Evaluates semantic similarity with pluggable backends.
 
@@ -154,6 +365,7 @@ class SemanticEvaluator(BasePydanticEvaluator):
         self,
         llm_client: LLMClient,
         backend: Literal["llm", "faiss"] = "llm",
+        cache: Optional[SemanticCache] = None,
     ):
         """Initialize semantic evaluator with specified backend.
 
@@ -162,6 +374,8 @@ class SemanticEvaluator(BasePydanticEvaluator):
             backend: Similarity computation backend
                     - "llm": LLM reasoning (default, rich explanations)
                     - "faiss": Vector embeddings (fast, free, requires arbiter[scale])
+            cache: Optional SemanticCache to reuse scores for near-duplicate
+                   (output, reference) pairs
 
         Raises:
             ImportError: If backend="faiss" but sentence-transformers not installed
@@ -173,9 +387,13 @@ class SemanticEvaluator(BasePydanticEvaluator):
             >>>
             >>> # Fast FAISS backend (requires: pip install arbiter[scale])
             >>> evaluator_fast = SemanticEvaluator(llm_client, backend="faiss")
+            >>>
+            >>> # Reuse scores for near-duplicate pairs
+            >>> evaluator_cached = SemanticEvaluator(llm_client, cache=SemanticCache())
         """
         super().__init__(llm_client)
         self.backend_type = backend
+        self.cache = cache
 
         # Initialize similarity backend
         if backend == "faiss":
@@ -219,6 +437,55 @@ class SemanticEvaluator(BasePydanticEvaluator):
             ...     output="This text is clear and coherent"
             ... )
         """
+        # Exact match: Identical texts need no backend call
+        if reference:
+            exact_score = self._exact_match_score(output, reference)
+            if exact_score is not None:
+                return exact_score
+
+        # Cache: Reuse the score of a near-duplicate pair if one is stored
+        if self.cache is not None and reference:
+            vector = self.cache.embed(output, reference)
+            cached = self.cache.get(vector, criteria)
+            if cached is not None:
+                return cached.model_copy(
+                    update={"metadata": {**cached.metadata, "cache_hit": True}}
+                )
+
+            score = await self._evaluate_uncached(output, reference, criteria)
+            self.cache.put(vector, criteria, score)
+            return score
+
+        return await self._evaluate_uncached(output, reference, criteria)
+
+    def _exact_match_score(self, output: str, reference: str) -> Optional[Score]:
+        """Score identical pairs locally, or return None to use the backend."""
+        if output == reference:
+            match, confidence = "exact", 1.0
+            explanation = "Output and reference are identical."
+        elif _normalize_text(output) == _normalize_text(reference):
+            match, confidence = "normalized", 0.95
+            explanation = (
+                "Output and reference are identical apart from case and whitespace."
+            )
+        else:
+            return None
+
+        return Score(
+            name=self.name,
+            value=1.0,
+            confidence=confidence,
+            explanation=explanation,
+            metadata={"exact_match": match},
+        )
+
+    async def _evaluate_uncached(
+        self,
+        output: str,
+        reference: Optional[str],
+        criteria: Optional[str],
+    ) -> Score:
+        """Evaluate with the configured backend, bypassing the cache."""
         # FAISS backend: Use direct similarity computation
         if self.backend_type == "faiss":
             if not reference:
@@ -250,28 +517,7 @@ class SemanticEvaluator(BasePydanticEvaluator):
 
     def _get_system_prompt(self) -> str:
         """Get system prompt defining semantic evaluation approach."""
-        return """You are an expert at evaluating semantic similarity between texts.
-
-Your task is to assess how similar two texts are in MEANING, not just in wording.
-
-Consider:
-- Core concepts and ideas conveyed
-- Factual accuracy and information content
-- Intent and purpose of the text
-- Logical relationships between ideas
-
-Ignore:
-- Exact wording or phrasing
-- Grammatical structure
-- Writing style or tone (unless it changes meaning)
-
-Provide:
-- A similarity score from 0.0 (completely different meaning) to 1.0 (identical meaning)
-- Your confidence in this assessment
-- Clear explanation of your reasoning
-- Key similarities and differences you identified
-
-Be precise and analytical in your evaluation."""
+        return _SEMANTIC_SYSTEM_PROMPT
 
     def _get_user_prompt(
         self, output: str, reference: Optional[str], criteria: Optional[str]
@@ -281,31 +527,14 @@ Be precise and analytical in your evaluation."""
             # If no reference, we can't do semantic comparison
             # Fall back to reference-free evaluation with criteria
             if criteria:
-                return f"""Evaluate the semantic quality of this text based on the criteria: {criteria}
-
-Text to evaluate:
-{output}
-
-Provide your semantic quality assessment."""
-            else:
-                # No reference and no criteria - evaluate general semantic coherence
-                return f"""Evaluate the semantic coherence and clarity of this text:
-
-{output}
-
-Assess how well the text conveys clear meaning and logical ideas."""
+                return _CRITERIA_PROMPT_TEMPLATE.format(
+                    output=output, criteria=criteria
+                )
+            # No reference and no criteria - evaluate general semantic coherence
+            return _COHERENCE_PROMPT_TEMPLATE.format(output=output)
 
         # Standard semantic similarity evaluation
-        return f"""Compare the semantic similarity of these two texts:
-
-OUTPUT (to evaluate):
-{output}
-
-REFERENCE (ground truth):
-{reference}
-
-Assess how similar they are in MEANING. Consider whether they convey the same information,
-even if expressed differently. Provide a detailed analysis."""
+        return _SIMILARITY_PROMPT_TEMPLATE.format(output=output, reference=reference)
 
     def _get_response_type(self) -> Type[BaseModel]:
         """Use custom semantic response model."""
@@ -315,28 +544,25 @@ even if expressed differently. Provide a detailed analysis."""
         """Extract Score from semantic response."""
         semantic_response = cast(SemanticResponse, response)
 
-        # Build detailed explanation
-        explanation_parts = [semantic_response.explanation]
-
-        if (
-            hasattr(semantic_response, "key_similarities")
-            and semantic_response.key_similarities
-        ):
-            explanation_parts.append(
-                "\n\nKey Similarities:\n- "
-                + "\n- ".join(semantic_response.key_similarities)
-            )
-
-        if (
-            hasattr(semantic_response, "key_differences")
-            and semantic_response.key_differences
-        ):
-            explanation_parts.append(
-                "\n\nKey Differences:\n- "
-                + "\n- ".join(semantic_response.key_differences)
+        similarities = semantic_response.key_similarities
+        differences = semantic_response.key_differences
+
+        # Build detailed explanation; absent sections join as empty strings
+        full_explanation = "".join(
+            (
+                semantic_response.explanation,
+                (
+                    "\n\nKey Similarities:\n- " + "\n- ".join(similarities)
+                    if similarities
+                    else ""
+                ),
+                (
+                    "\n\nKey Differences:\n- " + "\n- ".join(differences)
+                    if differences
+                    else ""
+                ),
             )
-
-        full_explanation = "".join(explanation_parts)
+        )
 
         return Score(
             name=self.name,  # Use evaluator's name property for consistency
@@ -344,11 +570,7 @@ even if expressed differently. Provide a detailed analysis."""
             confidence=semantic_response.confidence,
             explanation=full_explanation,
             metadata={
-                "similarities_count": len(
-                    getattr(semantic_response, "key_similarities", [])
-                ),
-                "differences_count": len(
-                    getattr(semantic_response, "key_differences", [])
-                ),
+                "similarities_count": len(similarities),
+                "differences_count": len(differences),
             },
         )
@@ -0,0 +1,287 @@
+"""Pairwise Comparison via the OpenAI Batch API - Offline A/B Testing
+
+This example runs an A/B test suite through OpenAI's Batch API instead of
+the realtime compare() API. Batch jobs complete within 24 hours at roughly
+half the per-token price, and the whole suite is one upload instead of one
+request per comparison. Use it for offline evaluation where latency does
+not matter.
+
+Key Features:
+- Prompts and structured output equivalent to PairwiseComparisonEvaluator
+  (PairwiseResponse schema via response_format instead of tool calls)
+- One JSONL upload for the whole suite
+- Same A/B suite as Example 5 of pairwise_with_middleware.py
+- Results parsed back into PairwiseResponse / ComparisonResult objects
+- Failed and unparseable requests reported by custom_id
+
+Requirements:
+    export OPENAI_API_KEY=your_key_here
+
+Run with:
+    python examples/pairwise_batch.py
+
+    # Resume polling a batch submitted earlier
+    python examples/pairwise_batch.py --batch-id batch_abc123
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+from openai.types import Batch
+from pydantic import ValidationError
+
+from arbiter_ai import PairwiseComparisonEvaluator
+from arbiter_ai.core.models import ComparisonResult
+from arbiter_ai.evaluators.pairwise import PairwiseResponse
+
+MODEL = "gpt-4o-mini"
+SEED = 94032
+MAX_COMPLETION_TOKENS = 1000
+POLL_INTERVAL_SECONDS = 30
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Same A/B test suite as Example 5 of pairwise_with_middleware.py
+AB_TEST_CASES = [
+    {
+        "output_a": "Click the button to continue.",
+        "output_b": "Click 'Continue' to proceed to the next step.",
+        "criteria": "clarity, specificity",
+    },
+    {
+        "output_a": "An error occurred.",
+        "output_b": "We couldn't save your changes because the file is "
+        "read-only. Try saving to a different location.",
+        "criteria": "helpfulness, clarity",
+    },
+    {
+        "output_a": "Your password must be strong.",
+        "output_b": "Use at least 12 characters, including a number and a symbol.",
+        "criteria": "actionability, clarity",
+    },
+    {
+        "output_a": "Thanks for signing up!",
+        "output_b": "Thanks for signing up! Check your inbox to confirm your "
+        "email address.",
+        "criteria": "completeness, helpfulness",
+    },
+    {
+        "output_a": "Loading...",
+        "output_b": "Loading your dashboard. This usually takes a few seconds.",
+        "criteria": "clarity, user experience",
+    },
+]
+
+
+def build_batch_requests(
+    evaluator: PairwiseComparisonEvaluator, cases: List[Dict[str, str]]
+) -> List[Dict[str, Any]]:
+    """Build one /v1/chat/completions batch request per comparison."""
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "PairwiseResponse",
+            "schema": PairwiseResponse.model_json_schema(),
+        },
+    }
+    system_prompt = evaluator._get_system_prompt()
+
+    requests = []
+    for i, case in enumerate(cases):
+        user_prompt = evaluator._get_comparison_prompt(
+            case["output_a"], case["output_b"], case["criteria"], None
+        )
+        requests.append(
+            {
+                "custom_id": f"ab_{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": MODEL,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    "response_format": response_format,
+                    "max_completion_tokens": MAX_COMPLETION_TOKENS,
+                    "seed": SEED,
+                    "temperature": 0.0,
+                },
+            }
+        )
+    return requests
+
+
+async def submit_batch(client: AsyncOpenAI, requests: List[Dict[str, Any]]) -> str:
+    """Upload the JSONL request file and create the batch job."""
+    jsonl = "\n".join(json.dumps(request) for request in requests)
+    batch_file = await client.files.create(
+        file=("pairwise_batch.jsonl", jsonl.encode("utf-8")),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+        metadata={"source": "arbiter pairwise_batch example"},
+    )
+    return batch.id
+
+
+async def wait_for_batch(client: AsyncOpenAI, batch_id: str) -> Batch:
+    """Poll until the batch reaches a terminal status."""
+    while True:
+        batch = await client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        progress = f"{counts.completed}/{counts.total}" if counts else "n/a"
+        print(f"  Status: {batch.status} ({progress} completed)")
+
+        if batch.status in TERMINAL_STATUSES:
+            return batch
+
+        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+
+async def fetch_results(
+    client: AsyncOpenAI, output_file_id: str
+) -> Dict[str, PairwiseResponse]:
+    """Download batch output and parse each line into a PairwiseResponse.
+
+    Lines that failed or do not validate (e.g. a completion truncated by
+    max_completion_tokens) are reported and skipped so the rest survive.
+    """
+    content = await client.files.content(output_file_id)
+
+    responses: Dict[str, PairwiseResponse] = {}
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        custom_id = record["custom_id"]
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            print(f"  ⚠️  {custom_id} failed: {record.get('error') or response}")
+            continue
+
+        message = response["body"]["choices"][0]["message"]["content"]
+        try:
+            responses[custom_id] = PairwiseResponse.model_validate_json(message)
+        except ValidationError as e:
+            print(f"  ⚠️  {custom_id} returned an invalid response: {e}")
+
+    return responses
+
+
+async def report_errors(client: AsyncOpenAI, error_file_id: str) -> None:
+    """Print requests the batch rejected (these never reach the output file)."""
+    content = await client.files.content(error_file_id)
+
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        error = record.get("error") or (record.get("response") or {}).get("body")
+        print(f"  ⚠️  {record['custom_id']} failed: {error}")
+
+
+def to_comparison_result(
+    case: Dict[str, str], response: PairwiseResponse
+) -> ComparisonResult:
+    """Convert a parsed batch response into the same result compare() returns."""
+    return ComparisonResult(
+        output_a=case["output_a"],
+        output_b=case["output_b"],
+        criteria=case["criteria"],
+        winner=response.winner,
+        confidence=response.confidence,
+        reasoning=response.reasoning,
+        aspect_scores={
+            aspect.aspect: {
+                "output_a": aspect.output_a_score,
+                "output_b": aspect.output_b_score,
+            }
+            for aspect in response.aspect_comparisons
+        },
+        metadata={"evaluator": "pairwise_comparison", "source": "openai_batch"},
+    )
+
+
+async def main(batch_id: Optional[str] = None):
+    """Run the A/B test suite through the OpenAI Batch API."""
+
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Ensure API key is set
+    if not os.getenv("OPENAI_API_KEY"):
+        print("⚠️  Please set OPENAI_API_KEY environment variable")
+        return
+
+    print("🔍 Arbiter - Pairwise Comparison via Batch API")
+    print("=" * 60)
+
+    client = AsyncOpenAI()
+
+    if batch_id is None:
+        print("\n📤 Submitting batch")
+        print("-" * 60)
+        evaluator = PairwiseComparisonEvaluator(model=MODEL)
+        requests = build_batch_requests(evaluator, AB_TEST_CASES)
+        batch_id = await submit_batch(client, requests)
+        print(f"  Submitted {len(requests)} comparisons as {batch_id}")
+        print(f"  Resume later with: --batch-id {batch_id}")
+
+    print("\n⏳ Waiting for batch (can take up to 24h)")
+    print("-" * 60)
+    batch = await wait_for_batch(client, batch_id)
+
+    if batch.error_file_id:
+        print("\n❌ Failed Requests")
+        print("-" * 60)
+        await report_errors(client, batch.error_file_id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        print(f"  ❌ Batch finished with status: {batch.status}")
+        return
+
+    responses = await fetch_results(client, batch.output_file_id)
+
+    print("\n📊 Results")
+    print("-" * 60)
+    wins = {"output_a": 0, "output_b": 0, "tie": 0}
+    confidences: List[float] = []
+    for i, case in enumerate(AB_TEST_CASES):
+        response = responses.get(f"ab_{i}")
+        if response is None:
+            print(f"  Case {i + 1}: no result")
+            continue
+
+        result = to_comparison_result(case, response)
+        wins[result.winner] += 1
+        confidences.append(result.confidence)
+        print(
+            f"  Case {i + 1}: winner={result.winner}, "
+            f"confidence={result.confidence:.3f}"
+        )
+
+    print("\n📊 A/B Test Summary:")
+    print(f"  Variant A wins: {wins['output_a']}")
+    print(f"  Variant B wins: {wins['output_b']}")
+    print(f"  Ties: {wins['tie']}")
+    print(f"  Results: {len(confidences)}/{len(AB_TEST_CASES)}")
+    if confidences:
+        print(f"  Average Confidence: {sum(confidences) / len(confidences):.3f}")
+
+    print("\n📖 Related Examples:")
+    print("  • See pairwise_with_middleware.py for realtime A/B testing")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-id", help="Resume polling an existing batch")
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_id))
@@ -0,0 +1,333 @@
+"""Pairwise Comparison with Middleware - Observable A/B Testing
+
+This example demonstrates running pairwise comparisons through the middleware
+pipeline, so A/B tests get the same logging, metrics, and custom hooks as
+regular evaluations.
+
+Key Features:
+- LoggingMiddleware and MetricsMiddleware with compare()
+- LogAndMetricsMiddleware for logging and metrics in a single step
+- One shared LLM client across all comparisons
+- Concurrent comparisons bounded by a semaphore
+- Connection pool warm-up before the A/B test suite
+- Custom middleware that detects pairwise comparisons
+- Metrics aggregation across an A/B test suite
+
+Requirements:
+    export OPENAI_API_KEY=your_key_here
+
+Run with:
+    python examples/pairwise_with_middleware.py
+
+    # Optional: faster event loop on Linux/macOS
+    pip install "arbiter-ai[perf]"
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+from pydantic_ai.models import cached_async_http_client
+
+from arbiter_ai import compare
+from arbiter_ai.core import LLMClient, LLMManager, MiddlewarePipeline, Provider
+from arbiter_ai.core.middleware import (
+    LogAndMetricsMiddleware,
+    LoggingMiddleware,
+    MetricsMiddleware,
+    Middleware,
+    MiddlewareResult,
+)
+from arbiter_ai.core.models import ComparisonResult
+from arbiter_ai.core.type_defs import MiddlewareContext
+
+# Configure logging to see middleware output
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+
+MODEL = "gpt-4o-mini"
+
+# Maximum number of comparisons in flight at once. Keeps bursts under
+# provider rate limits while still overlapping network latency.
+MAX_CONCURRENT_COMPARISONS = 5
+
+# A/B test suite for Example 5. examples/pairwise_batch.py keeps a copy of
+# these cases to run the same suite through the OpenAI Batch API.
+AB_TEST_CASES = [
+    {
+        "output_a": "Click the button to continue.",
+        "output_b": "Click 'Continue' to proceed to the next step.",
+        "criteria": "clarity, specificity",
+    },
+    {
+        "output_a": "An error occurred.",
+        "output_b": "We couldn't save your changes because the file is "
+        "read-only. Try saving to a different location.",
+        "criteria": "helpfulness, clarity",
+    },
+    {
+        "output_a": "Your password must be strong.",
+        "output_b": "Use at least 12 characters, including a number and a symbol.",
+        "criteria": "actionability, clarity",
+    },
+    {
+        "output_a": "Thanks for signing up!",
+        "output_b": "Thanks for signing up! Check your inbox to confirm your "
+        "email address.",
+        "criteria": "completeness, helpfulness",
+    },
+    {
+        "output_a": "Loading...",
+        "output_b": "Loading your dashboard. This usually takes a few seconds.",
+        "criteria": "clarity, user experience",
+    },
+]
+
+
+async def compare_all(
+    cases: List[Dict[str, str]],
+    middleware: MiddlewarePipeline,
+    llm_client: LLMClient,
+    max_concurrency: int = MAX_CONCURRENT_COMPARISONS,
+) -> List[ComparisonResult]:
+    """Run all comparisons concurrently, preserving input order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(case: Dict[str, str]) -> ComparisonResult:
+        async with semaphore:
+            return await compare(
+                output_a=case["output_a"],
+                output_b=case["output_b"],
+                criteria=case["criteria"],
+                llm_client=llm_client,
+                middleware=middleware,
+            )
+
+    return await asyncio.gather(*[run_one(case) for case in cases])
+
+
+async def warm_connections(model: str, connections: int) -> None:
+    """Open keep-alive connections to OpenAI before a burst of comparisons.
+
+    PydanticAI sends every OpenAI request through one shared httpx client
+    (default limits: 100 connections, 20 kept alive). Making a few
+    concurrent requests through that same client pays the DNS and TLS setup
+    up front, so the first comparisons reuse warm sockets. models.retrieve
+    costs no tokens.
+    """
+    client = AsyncOpenAI(http_client=cached_async_http_client(provider="openai"))
+    await asyncio.gather(*[client.models.retrieve(model) for _ in range(connections)])
+
+
+class PairwiseDetectorMiddleware(Middleware):
+    """Custom middleware that reports details of pairwise comparisons."""
+
+    async def process(
+        self,
+        output: str,
+        reference: Optional[str],
+        next_handler: Callable[[str, Optional[str]], Any],
+        context: MiddlewareContext,
+    ) -> MiddlewareResult:
+        # execute_comparison() sets pairwise_data alongside
+        # is_pairwise_comparison, so one lookup answers both
+        pairwise_data = context.get("pairwise_data")
+        if pairwise_data is not None:
+            print("  🔀 Pairwise comparison detected")
+            print(f"    Output A: {pairwise_data.get('output_a', '')[:50]}...")
+            print(f"    Output B: {pairwise_data.get('output_b', '')[:50]}...")
+            print(f"    Criteria: {pairwise_data.get('criteria') or 'N/A'}")
+
+        result: MiddlewareResult = await next_handler(output, reference)
+        return result
+
+
+async def main():
+    """Run pairwise comparison with middleware examples."""
+
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Ensure API key is set
+    if not os.getenv("OPENAI_API_KEY"):
+        print("⚠️  Please set OPENAI_API_KEY environment variable")
+        return
+
+    print("🔍 Arbiter - Pairwise Comparison with Middleware")
+    print("=" * 60)
+
+    # One client shared by every comparison below, so they reuse the same
+    # agent configuration instead of each compare() fetching its own
+    llm_client = await LLMManager.get_client(
+        provider=Provider.OPENAI, model=MODEL, temperature=0.0
+    )
+
+    # Example 1: Logging middleware with compare()
+    print("\n📝 Example 1: Logging Middleware")
+    print("-" * 60)
+
+    logging_pipeline = MiddlewarePipeline([LoggingMiddleware(log_level="INFO")])
+
+    comparison1 = await compare(
+        output_a="Paris is the capital of France.",
+        output_b="The capital of France is Paris, a city on the Seine.",
+        criteria="accuracy, completeness",
+        llm_client=llm_client,
+        middleware=logging_pipeline,
+    )
+
+    print(f"  Winner: {comparison1.winner.upper()}")
+    print(f"  Confidence: {comparison1.confidence:.3f}")
+    print("\n💡 Check the logs above for middleware output!")
+
+    # Example 2: Metrics across several comparisons
+    print("\n\n📝 Example 2: Metrics Middleware")
+    print("-" * 60)
+
+    metrics_middleware = MetricsMiddleware()
+    pipeline_with_metrics = MiddlewarePipeline([metrics_middleware])
+
+    test_cases = [
+        {
+            "output_a": "Python is a programming language.",
+            "output_b": "Python is a high-level, interpreted programming language "
+            "known for its readability.",
+            "criteria": "completeness, clarity",
+        },
+        {
+            "output_a": "Water boils at 100 degrees Celsius at sea level.",
+            "output_b": "Water boils at 100C.",
+            "criteria": "accuracy, completeness",
+        },
+        {
+            "output_a": "The mitochondria is the powerhouse of the cell.",
+            "output_b": "Mitochondria produce ATP through cellular respiration, "
+            "supplying most of the cell's chemical energy.",
+            "criteria": "technical detail, accuracy",
+        },
+    ]
+
+    results = await compare_all(test_cases, pipeline_with_metrics, llm_client)
+    for i, result in enumerate(results, 1):
+        print(
+            f"  Test {i}: winner={result.winner}, "
+            f"confidence={result.confidence:.3f}"
+        )
+
+    metrics = metrics_middleware.get_metrics()
+    print("\n📊 Accumulated Metrics:")
+    print(f"  Total Requests: {metrics['total_requests']}")
+    print(f"  Errors: {metrics['errors']}")
+    print(f"  Avg Time per Request: {metrics.get('avg_time_per_request', 0.0):.3f}s")
+    print(f"  Average Confidence: {metrics['average_score']:.3f}")
+    print(f"  Tokens Used: {metrics['tokens_used']:,}")
+
+    # Example 3: Combined logging and metrics pipeline
+    print("\n\n📝 Example 3: Combined Middleware Pipeline")
+    print("-" * 60)
+
+    # One fused middleware instead of chaining LoggingMiddleware and
+    # MetricsMiddleware: a single process() call and timer per request
+    combined_pipeline = MiddlewarePipeline([LogAndMetricsMiddleware(log_level="INFO")])
+
+    comparison3 = await compare(
+        output_a="Our API is fast and reliable.",
+        output_b="Our API serves requests with a p99 latency of 45ms and has "
+        "maintained 99.99% uptime over the last 12 months, as verified by "
+        "an independent monitoring service.",
+        criteria="specificity, technical detail, credibility",
+        reference="Describe the performance of your API.",
+        llm_client=llm_client,
+        middleware=combined_pipeline,
+    )
+
+    print(f"  Winner: {comparison3.winner.upper()}")
+    print(f"  Confidence: {comparison3.confidence:.3f}")
+    print(f"  Reasoning: {comparison3.reasoning[:200]}...")
+
+    if comparison3.aspect_scores:
+        print("\n  Aspect Scores:")
+        for aspect, scores in comparison3.aspect_scores.items():
+            print(
+                f"    {aspect}: A={scores['output_a']:.2f}, "
+                f"B={scores['output_b']:.2f}"
+            )
+
+    # Example 4: Custom middleware that detects pairwise comparisons
+    print("\n\n📝 Example 4: Custom Pairwise-Aware Middleware")
+    print("-" * 60)
+
+    detector_pipeline = MiddlewarePipeline([PairwiseDetectorMiddleware()])
+
+    comparison4 = await compare(
+        output_a="Restart the server to fix the issue.",
+        output_b="Check the logs for errors, then restart the affected service "
+        "if the error indicates a stuck process.",
+        criteria="helpfulness, safety",
+        llm_client=llm_client,
+        middleware=detector_pipeline,
+    )
+
+    print(f"\n  Winner: {comparison4.winner.upper()}")
+    print(f"  Confidence: {comparison4.confidence:.3f}")
+
+    # Example 5: A/B test suite with quiet logging and metrics
+    print("\n\n📝 Example 5: A/B Testing with Metrics")
+    print("-" * 60)
+
+    # Pay connection setup before the timed suite, one socket per slot
+    await warm_connections(MODEL, MAX_CONCURRENT_COMPARISONS)
+
+    # DEBUG is below the INFO threshold set by basicConfig above, so the
+    # per-request log lines are skipped after a single isEnabledFor check
+    ab_metrics = LogAndMetricsMiddleware(log_level="DEBUG")
+    ab_pipeline = MiddlewarePipeline([ab_metrics])
+
+    ab_results = await compare_all(AB_TEST_CASES, ab_pipeline, llm_client)
+
+    wins = {"output_a": 0, "output_b": 0, "tie": 0}
+    for i, result in enumerate(ab_results, 1):
+        wins[result.winner] += 1
+        print(
+            f"  Case {i}: winner={result.winner}, "
+            f"confidence={result.confidence:.3f}"
+        )
+
+    ab_stats = ab_metrics.get_metrics()
+    print("\n📊 A/B Test Summary:")
+    print(f"  Variant A wins: {wins['output_a']}")
+    print(f"  Variant B wins: {wins['output_b']}")
+    print(f"  Ties: {wins['tie']}")
+    print(f"  Total Requests: {ab_stats['total_requests']}")
+    print(f"  Avg Time per Request: {ab_stats.get('avg_time_per_request', 0.0):.3f}s")
+
+    # Summary
+    print("\n\n" + "=" * 60)
+    print("✅ Examples Complete!")
+    print("\nKey Features Demonstrated:")
+    print("  • Middleware pipelines work with compare()")
+    print("  • Concurrent comparisons with bounded concurrency")
+    print("  • Connection warm-up before an A/B test suite")
+    print("  • Metrics aggregation across comparisons")
+    print("  • Custom middleware can detect pairwise comparisons")
+
+    print("\n📖 Related Examples:")
+    print("  • See pairwise_comparison_example.py for pairwise basics")
+    print("  • See middleware_usage.py for middleware with evaluate()")
+
+
+if __name__ == "__main__":
+    # Prefer uvloop's libuv event loop when installed (arbiter-ai[perf])
+    try:
+        import uvloop
+
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+
+    run(main())
@@ -120,7 +120,7 @@ class TestMultiEvaluatorErrorHandling:
 
         for evaluator in evaluators:
             try:
-                score = await evaluator.evaluate("test", "test")
+                score = await evaluator.evaluate("test", "test reference")
                 scores.append(score)
             except Exception as e:
                 errors[evaluator.name] = str(e)
@@ -312,7 +312,7 @@ class TestMultiEvaluatorErrorHandling:
         for evaluator in [semantic_eval, failing_eval]:
             evaluator.clear_interactions()
             try:
-                score = await evaluator.evaluate("test", "test")
+                score = await evaluator.evaluate("test", "test reference")
                 scores.append(score)
                 evaluator_names.append(evaluator.name)
             except Exception as e:
@@ -344,7 +344,7 @@ class TestMultiEvaluatorErrorHandling:
 
         evaluator = SemanticEvaluator(mock_llm_client)
         try:
-            score = await evaluator.evaluate("test", "test")
+            score = await evaluator.evaluate("test", "test reference")
             scores.append(score)
         except Exception as e:
             errors[evaluator.name] = str(e)
@@ -357,7 +357,7 @@ class TestMultiEvaluatorErrorHandling:
         with pytest.raises(EvaluatorError, match="All evaluators failed"):
             await _evaluate_impl(
                 output="test",
-                reference="test",
+                reference="test reference",
                 evaluators=["semantic"],
                 llm_client=mock_llm_client,
             )
@@ -395,7 +395,7 @@ class TestMultiEvaluatorErrorHandling:
 
         result = await evaluate(
             output="Test",
-            reference="Test",
+            reference="Test reference",
             evaluators=["semantic", "custom_criteria"],
             criteria="test",
             llm_client=mock_llm_client,
@@ -1,12 +1,15 @@
 """Unit tests for middleware.py."""
 
+import asyncio
 import logging
 from typing import Optional
+from unittest.mock import patch
 
 import pytest
 
 from arbiter_ai.core.middleware import (
     CachingMiddleware,
+    LogAndMetricsMiddleware,
     LoggingMiddleware,
     MetricsMiddleware,
     MiddlewarePipeline,
@@ -123,6 +126,39 @@ class TestLoggingMiddleware:
         assert "Evaluation failed" in caplog.text
         assert "ValueError" in caplog.text
 
+    @pytest.mark.asyncio
+    async def test_logging_suppressed_below_level(self, eval_result):
+        """Test that a disabled level skips logger.log and message formatting."""
+
+        class SliceTrackingStr(str):
+            sliced = False
+
+            def __getitem__(self, key):
+                SliceTrackingStr.sliced = True
+                return super().__getitem__(key)
+
+        middleware = LoggingMiddleware(log_level="DEBUG")
+
+        async def mock_handler(
+            output: str, reference: Optional[str]
+        ) -> EvaluationResult:
+            return eval_result
+
+        with patch("arbiter_ai.core.middleware.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+
+            result = await middleware.process(
+                output=SliceTrackingStr("Test output"),
+                reference=SliceTrackingStr("Test reference"),
+                next_handler=mock_handler,
+                context={},
+            )
+
+        assert result == eval_result
+        mock_logger.isEnabledFor.assert_called_with(logging.DEBUG)
+        mock_logger.log.assert_not_called()
+        assert SliceTrackingStr.sliced is False
+
 
 class TestMetricsMiddleware:
     """Test MetricsMiddleware."""
@@ -186,6 +222,133 @@ class TestMetricsMiddleware:
         assert metrics["total_requests"] == 2
         assert metrics["errors"] == 1
 
+    @pytest.mark.asyncio
+    async def test_metrics_average_with_concurrent_requests(self, comparison_result):
+        """Test that the average ignores requests still in flight."""
+        middleware = MetricsMiddleware()
+
+        async def mock_handler(
+            output: str, reference: Optional[str]
+        ) -> ComparisonResult:
+            # Yield so every request is counted before any completes
+            await asyncio.sleep(0)
+            return comparison_result
+
+        await asyncio.gather(
+            *[
+                middleware.process(
+                    output="Test",
+                    reference=None,
+                    next_handler=mock_handler,
+                    context={},
+                )
+                for _ in range(3)
+            ]
+        )
+
+        metrics = middleware.get_metrics()
+        assert metrics["total_requests"] == 3
+        assert metrics["completed_requests"] == 3
+        assert metrics["average_score"] == pytest.approx(0.9)
+
+
+class TestLogAndMetricsMiddleware:
+    """Test LogAndMetricsMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_logs_and_collects_metrics(self, caplog, comparison_result):
+        """Test that one middleware both logs and records metrics."""
+        caplog.set_level(logging.INFO)
+
+        middleware = LogAndMetricsMiddleware(log_level="INFO")
+
+        async def mock_handler(
+            output: str, reference: Optional[str]
+        ) -> ComparisonResult:
+            return comparison_result
+
+        for _ in range(2):
+            result = await middleware.process(
+                output="Test output",
+                reference="Test reference",
+                next_handler=mock_handler,
+                context={},
+            )
+
+        assert result == comparison_result
+        assert "Test output" in caplog.text
+        assert "winner=output_a" in caplog.text
+
+        metrics = middleware.get_metrics()
+        assert metrics["total_requests"] == 2
+        assert metrics["average_score"] == pytest.approx(0.9)
+        assert metrics["tokens_used"] == 200
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests(self, caplog, comparison_result):
+        """Test metrics and logs when requests are dispatched concurrently."""
+        caplog.set_level(logging.INFO)
+
+        middleware = LogAndMetricsMiddleware(log_level="INFO")
+
+        async def mock_handler(
+            output: str, reference: Optional[str]
+        ) -> ComparisonResult:
+            # Yield so every request is counted before any completes
+            await asyncio.sleep(0)
+            return comparison_result
+
+        results = await asyncio.gather(
+            *[
+                middleware.process(
+                    output=f"Output {i}",
+                    reference=None,
+                    next_handler=mock_handler,
+                    context={},
+                )
+                for i in range(4)
+            ]
+        )
+
+        assert results == [comparison_result] * 4
+        assert caplog.text.count("winner=output_a") == 4
+
+        metrics = middleware.get_metrics()
+        assert metrics["total_requests"] == 4
+        assert metrics["completed_requests"] == 4
+        assert metrics["average_score"] == pytest.approx(0.9)
+        assert metrics["tokens_used"] == 400
+
+    @pytest.mark.asyncio
+    async def test_error_is_logged_and_counted(self, caplog):
+        """Test that failures are logged and counted as errors."""
+        caplog.set_level(logging.ERROR)
+
+        middleware = LogAndMetricsMiddleware()
+
+        async def mock_handler(
+            output: str, reference: Optional[str]
+        ) -> EvaluationResult:
+            raise ValueError("Test error")
+
+        with pytest.raises(ValueError, match="Test error"):
+            await middleware.process(
+                output="Test output",
+                reference=None,
+                next_handler=mock_handler,
+                context={},
+            )
+
+        assert "Evaluation failed" in caplog.text
+        assert middleware.get_metrics()["errors"] == 1
+
+    def test_found_as_metrics_middleware(self):
+        """Test that pipeline lookup by MetricsMiddleware finds it."""
+        middleware = LogAndMetricsMiddleware()
+        pipeline = MiddlewarePipeline([middleware])
+
+        assert pipeline.get_middleware(MetricsMiddleware) is middleware
+
 
 class TestCachingMiddleware:
     """Test CachingMiddleware."""
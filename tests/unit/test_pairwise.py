@@ -60,6 +60,23 @@ class TestPairwiseComparisonEvaluator:
         # Should have overall comparison instructions, not criteria-specific
         assert "overall" in prompt.lower() or "determine" in prompt.lower()
 
+    def test_comparison_prompt(self, evaluator):
+        """Test that _get_comparison_prompt includes outputs, reference, criteria."""
+        prompt = evaluator._get_comparison_prompt(
+            "first output", "second output", "accuracy", "the question"
+        )
+        assert "OUTPUT A:\nfirst output" in prompt
+        assert "OUTPUT B:\nsecond output" in prompt
+        assert "REFERENCE CONTEXT:\nthe question" in prompt
+        assert "EVALUATION CRITERIA:\naccuracy" in prompt
+
+    def test_comparison_prompt_without_criteria_or_reference(self, evaluator):
+        """Test that _get_comparison_prompt falls back to overall comparison."""
+        prompt = evaluator._get_comparison_prompt("first", "second", None, None)
+        assert "REFERENCE CONTEXT" not in prompt
+        assert "EVALUATION CRITERIA" not in prompt
+        assert "Compare the outputs overall" in prompt
+
     def test_response_type(self, evaluator):
         """Test that response type is correct."""
         response_type = evaluator._get_response_type()
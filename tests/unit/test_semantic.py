@@ -1,11 +1,15 @@
 """Unit tests for SemanticEvaluator."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from arbiter_ai.core.exceptions import EvaluatorError
-from arbiter_ai.evaluators.semantic import SemanticEvaluator, SemanticResponse
+from arbiter_ai.evaluators.semantic import (
+    SemanticCache,
+    SemanticEvaluator,
+    SemanticResponse,
+)
 from tests.conftest import MockAgentResult
 
 
@@ -129,6 +133,39 @@ class TestSemanticEvaluator:
         assert len(evaluator.interactions) == 1
         assert evaluator.interactions[0].purpose == "semantic_evaluation"
 
+    @pytest.mark.asyncio
+    async def test_evaluate_exact_match_skips_llm(self, evaluator, mock_agent):
+        """Test that identical output and reference score 1.0 without the LLM."""
+        mock_agent.run = AsyncMock()
+        evaluator.llm_client.create_agent = MagicMock(return_value=mock_agent)
+
+        score = await evaluator.evaluate(
+            output="Paris is the capital of France",
+            reference="Paris is the capital of France",
+        )
+
+        assert score.value == 1.0
+        assert score.confidence == 1.0
+        assert score.metadata["exact_match"] == "exact"
+        mock_agent.run.assert_not_called()
+        assert len(evaluator.interactions) == 0
+
+    @pytest.mark.asyncio
+    async def test_evaluate_normalized_match_skips_llm(self, evaluator, mock_agent):
+        """Test that case and whitespace differences still short-circuit."""
+        mock_agent.run = AsyncMock()
+        evaluator.llm_client.create_agent = MagicMock(return_value=mock_agent)
+
+        score = await evaluator.evaluate(
+            output="Paris is  the capital\nof France",
+            reference="paris is the capital of france",
+        )
+
+        assert score.value == 1.0
+        assert score.confidence < 1.0
+        assert score.metadata["exact_match"] == "normalized"
+        mock_agent.run.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_evaluate_without_reference(self, evaluator, mock_agent):
         """Test evaluation without reference text."""
@@ -304,6 +341,13 @@ class TestSemanticResponse:
         assert response.key_similarities == []
         assert response.key_differences == []
 
+    def test_response_is_frozen(self):
+        """Test that SemanticResponse cannot be modified after parsing."""
+        response = SemanticResponse(score=0.8, explanation="Test")
+
+        with pytest.raises(Exception):  # Pydantic frozen instance error
+            response.score = 0.1
+
     def test_response_score_validation(self):
         """Test that score must be between 0 and 1."""
         # Valid scores
@@ -317,3 +361,111 @@ class TestSemanticResponse:
 
         with pytest.raises(Exception):  # Pydantic validation error
             SemanticResponse(score=1.1, explanation="test")
+
+
+VOCAB = ["paris", "capital", "france", "berlin", "germany", "tokyo"]
+
+
+def bag_of_words(text: str) -> list[float]:
+    """Deterministic test embedder: word counts over a tiny vocabulary."""
+    words = text.lower().replace(".", "").split()
+    return [float(words.count(w)) for w in VOCAB]
+
+
+class TestSemanticCache:
+    """Test suite for SemanticCache and its use in SemanticEvaluator."""
+
+    @pytest.fixture
+    def cached_evaluator(self, mock_llm_client, mock_agent):
+        """Create a SemanticEvaluator with a cache and a mocked agent."""
+        mock_response = SemanticResponse(
+            score=0.9, confidence=0.85, explanation="Same meaning"
+        )
+        mock_agent.run = AsyncMock(return_value=MockAgentResult(mock_response))
+        mock_llm_client.create_agent = MagicMock(return_value=mock_agent)
+        cache = SemanticCache(embedder=bag_of_words)
+        return SemanticEvaluator(llm_client=mock_llm_client, cache=cache)
+
+    @pytest.mark.asyncio
+    async def test_repeated_pair_hits_cache(self, cached_evaluator, mock_agent):
+        """Test that a repeated pair is served from the cache."""
+        first = await cached_evaluator.evaluate(
+            output="Paris is the capital of France",
+            reference="The capital of France is Paris",
+        )
+        second = await cached_evaluator.evaluate(
+            output="Paris is the capital of France",
+            reference="The capital of France is Paris",
+        )
+
+        assert mock_agent.run.call_count == 1
+        assert "cache_hit" not in first.metadata
+        assert second.metadata["cache_hit"] is True
+        assert second.value == first.value
+        assert cached_evaluator.cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_pair_misses_cache(self, cached_evaluator, mock_agent):
+        """Test that dissimilar pairs call the LLM again."""
+        await cached_evaluator.evaluate(
+            output="Paris is the capital of France",
+            reference="The capital of France is Paris",
+        )
+        await cached_evaluator.evaluate(
+            output="Berlin is the capital of Germany",
+            reference="Tokyo is the capital",
+        )
+
+        assert mock_agent.run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_different_criteria_misses_cache(self, cached_evaluator, mock_agent):
+        """Test that criteria must match exactly for a cache hit."""
+        await cached_evaluator.evaluate(
+            output="Paris is the capital", reference="The capital is Paris"
+        )
+        await cached_evaluator.evaluate(
+            output="Paris is the capital",
+            reference="The capital is Paris",
+            criteria="accuracy",
+        )
+
+        assert mock_agent.run.call_count == 2
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = SemanticCache(embedder=bag_of_words, ttl=10.0)
+        vector = cache.embed("Paris", "France")
+        score = MagicMock()
+
+        with patch("arbiter_ai.evaluators.semantic.time.time", return_value=100.0):
+            cache.put(vector, None, score)
+        with patch("arbiter_ai.evaluators.semantic.time.time", return_value=105.0):
+            assert cache.get(vector, None) is score
+        with patch("arbiter_ai.evaluators.semantic.time.time", return_value=111.0):
+            assert cache.get(vector, None) is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = SemanticCache(embedder=bag_of_words, max_size=2)
+        paris = cache.embed("Paris", "France")
+        berlin = cache.embed("Berlin", "Germany")
+        tokyo = cache.embed("Tokyo", None)
+
+        cache.put(paris, None, MagicMock())
+        cache.put(berlin, None, MagicMock())
+        assert cache.get(paris, None) is not None  # Paris is now most recent
+        cache.put(tokyo, None, MagicMock())
+
+        assert cache.get(berlin, None) is None
+        assert cache.get(paris, None) is not None
+        assert cache.get_stats()["size"] == 2
+
+    def test_invalid_arguments(self):
+        """Test that invalid cache settings are rejected."""
+        with pytest.raises(ValueError):
+            SemanticCache(embedder=bag_of_words, threshold=0.0)
+        with pytest.raises(ValueError):
+            SemanticCache(embedder=bag_of_words, ttl=0)
+        with pytest.raises(ValueError):
+            SemanticCache(embedder=bag_of_words, max_size=0)